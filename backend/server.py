@@ -1,41 +1,98 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
-import uuid
-from datetime import datetime, timedelta
+from uuid6 import uuid7
+from datetime import datetime, timedelta, timezone
 import statistics
+import orjson
 import hashlib
+import hmac
+import secrets
+import asyncio
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, InvalidHashError
+from jose import jwt, JWTError
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    tz_aware=True,
+    maxPoolSize=50,
+    minPoolSize=10,  # keep warm connections so first queries skip the handshake
+    compressors="zstd,zlib",
+    retryWrites=True,
+    serverSelectionTimeoutMS=3000
+)
 db = client[os.environ['DB_NAME']]
 
+# JWT settings for API authentication. The secret must come from the
+# deployment environment, generate one with:
+#   python -c "import secrets; print(secrets.token_urlsafe(64))"
+JWT_SECRET = os.environ.get('JWT_SECRET', '')
+if not JWT_SECRET:
+    raise RuntimeError("JWT_SECRET is not set; generate a random secret and export it before starting the server")
+JWT_ALGORITHM = "HS256"
+JWT_EXPIRE_DAYS = 7
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Password hashing (Argon2id, tuned to roughly 50-100ms per hash)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+# Hash checked when a login names an unknown user, so that path costs the same
+# Argon2 verify as a wrong password and response times don't reveal usernames
+DUMMY_PASSWORD_HASH = password_hasher.hash(secrets.token_urlsafe(32))
+
+# Current time as an aware UTC datetime (datetime.utcnow is deprecated)
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+# Time-ordered UUIDv7 ids so new documents land at the tail of the id indexes
+def new_id() -> str:
+    return str(uuid7())
+
 # Helper function to hash passwords
 def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+    return password_hasher.hash(password)
+
+# Helper function to check a password against a stored hash
+def verify_password(password_hash: str, password: str) -> bool:
+    if not password_hash.startswith("$argon2"):
+        # Legacy unsalted SHA-256 hash from before the Argon2 migration
+        return hmac.compare_digest(password_hash, hashlib.sha256(password.encode()).hexdigest())
+    # PasswordHasher.verify already compares in constant time
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerifyMismatchError, InvalidHashError):
+        return False
 
 # User Models
+# Stored document models drop unknown fields (e.g. goal summary counters) and
+# are immutable once built
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    id: str = Field(default_factory=new_id)
     username: str
     password_hash: str
-    created_date: datetime = Field(default_factory=datetime.utcnow)
+    created_date: datetime = Field(default_factory=utcnow)
 
 class UserCreate(BaseModel):
     username: str
@@ -49,28 +106,36 @@ class UserResponse(BaseModel):
     id: str
     username: str
     created_date: datetime
+    access_token: str
+    token_type: str = "bearer"
 
 # Updated Goal Models (now with user_id)
 class Goal(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    id: str = Field(default_factory=new_id)
     user_id: str
     name: str
     target_amount: float
     current_amount: float = 0.0
-    created_date: datetime = Field(default_factory=datetime.utcnow)
+    created_date: datetime = Field(default_factory=utcnow)
     completed: bool = False
     completion_date: Optional[datetime] = None
 
 class GoalCreate(BaseModel):
     name: str
     target_amount: float
+    # Optional marker so test runs can bulk-delete the goals they created
+    test_session_id: Optional[str] = None
 
 class Transaction(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    id: str = Field(default_factory=new_id)
     goal_id: str
     user_id: str
     amount: float
-    transaction_date: datetime = Field(default_factory=datetime.utcnow)
+    transaction_date: datetime = Field(default_factory=utcnow)
     description: Optional[str] = None
 
 class TransactionCreate(BaseModel):
@@ -78,6 +143,10 @@ class TransactionCreate(BaseModel):
     amount: float
     description: Optional[str] = None
 
+class TransactionResult(BaseModel):
+    transaction: Transaction
+    goal: Goal
+
 class GoalProgress(BaseModel):
     goal: Goal
     progress_percentage: float
@@ -87,75 +156,185 @@ class GoalProgress(BaseModel):
     average_daily_savings: Optional[float]
 
 # Auth helper functions
-async def get_user_by_username(username: str):
-    return await db.users.find_one({"username": username})
+async def get_user_by_username(username: str, projection: Optional[dict] = None):
+    return await db.users.find_one({"username": username}, projection)
+
+# Helper function to issue an access token for a user
+def create_access_token(user_id: str) -> str:
+    payload = {"sub": user_id, "exp": utcnow() + timedelta(days=JWT_EXPIRE_DAYS)}
+    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-async def get_user_by_id(user_id: str):
-    return await db.users.find_one({"id": user_id})
+# Dependency resolving the authenticated user id from the bearer token, no DB hit
+async def current_user(authorization: Optional[str] = Header(None)) -> str:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])["sub"]
+    except (JWTError, KeyError):
+        raise HTTPException(status_code=401, detail="Invalid or expired token", headers={"WWW-Authenticate": "Bearer"})
 
 # User Authentication Endpoints
 @api_router.post("/register", response_model=UserResponse)
 async def register(user_input: UserCreate):
     # Check if username already exists
-    existing_user = await get_user_by_username(user_input.username)
+    existing_user = await get_user_by_username(user_input.username, {"_id": 0, "id": 1})
     if existing_user:
         raise HTTPException(status_code=400, detail="Username already exists")
     
     # Create new user with hashed password
-    user_dict = user_input.dict()
-    user_dict["password_hash"] = hash_password(user_input.password)
+    user_dict = user_input.model_dump()
+    loop = asyncio.get_running_loop()
+    user_dict["password_hash"] = await loop.run_in_executor(None, hash_password, user_input.password)
     user_dict.pop("password")  # Remove plain password
     
-    user_obj = User(**user_dict)
-    await db.users.insert_one(user_obj.dict())
+    user_obj = User(**user_dict, created_date=utcnow())
+    try:
+        await db.users.insert_one(user_obj.model_dump())
+    except DuplicateKeyError:
+        # A concurrent registration took the name after the check above
+        raise HTTPException(status_code=400, detail="Username already exists")
     
     return UserResponse(
         id=user_obj.id,
         username=user_obj.username,
-        created_date=user_obj.created_date
+        created_date=user_obj.created_date,
+        access_token=create_access_token(user_obj.id)
     )
 
 @api_router.post("/login", response_model=UserResponse)
 async def login(user_input: UserLogin):
     # Find user by username
-    user = await get_user_by_username(user_input.username)
+    user = await get_user_by_username(user_input.username, {"_id": 0})
+    
+    # Check password off the event loop, Argon2 is deliberately slow
+    loop = asyncio.get_running_loop()
     if not user:
+        await loop.run_in_executor(None, verify_password, DUMMY_PASSWORD_HASH, user_input.password)
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
-    # Check password
-    if user["password_hash"] != hash_password(user_input.password):
+    valid = await loop.run_in_executor(None, verify_password, user["password_hash"], user_input.password)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
+    # Upgrade legacy or outdated hashes now that we know the plain password
+    if not user["password_hash"].startswith("$argon2") or password_hasher.check_needs_rehash(user["password_hash"]):
+        new_hash = await loop.run_in_executor(None, hash_password, user_input.password)
+        await db.users.update_one({"id": user["id"]}, {"$set": {"password_hash": new_hash}})
+    
     return UserResponse(
         id=user["id"],
         username=user["username"],
-        created_date=user["created_date"]
+        created_date=user["created_date"],
+        access_token=create_access_token(user["id"])
     )
 
-# Helper function to calculate goal estimates
-async def calculate_goal_estimates(goal: Goal) -> dict:
-    # Get all transactions for this goal
-    transactions = await db.transactions.find({"goal_id": goal.id, "user_id": goal.user_id}).to_list(1000)
+# Helper function to stream a cursor as a JSON array without materializing it.
+# This bypasses response_model, so the caller's projection is the only thing
+# keeping internal fields (summary counters, test_session_id) out of the output,
+# and OPT_UTC_Z keeps datetimes in the same "...Z" form as the model responses
+async def stream_json_array(cursor):
+    yield b"["
+    first = True
+    async for doc in cursor:
+        body = orjson.dumps(doc, option=orjson.OPT_UTC_Z)
+        yield body if first else b"," + body
+        first = False
+    yield b"]"
+
+# Helper function to add a keyset pagination condition on (field, id), newest first
+def keyset_filter(query: dict, field: str, after: Optional[datetime], after_id: Optional[str]) -> dict:
+    if after is None:
+        return query
+    if after_id is None:
+        return {**query, field: {"$lt": after}}
+    return {**query, "$or": [{field: {"$lt": after}}, {field: after, "id": {"$lt": after_id}}]}
+
+# Helper function to build the goal update for `count` deposits totalling `amount`
+def goal_deposit_update(amount: float, now: datetime, count: int = 1) -> list:
+    # Pipeline update: bump current_amount and the running transaction summary,
+    # then recompute completion from the new amount in the same atomic write
+    # (no read-modify-write round-trip)
+    reached = {"$gte": ["$current_amount", "$target_amount"]}
+    return [
+        {"$set": {
+            "current_amount": {"$add": ["$current_amount", amount]},
+            "total_deposited": {"$add": [{"$ifNull": ["$total_deposited", 0]}, amount]},
+            "transaction_count": {"$add": [{"$ifNull": ["$transaction_count", 0]}, count]},
+            "first_transaction_date": {"$min": ["$first_transaction_date", now]},
+            "last_transaction_date": {"$max": ["$last_transaction_date", now]}
+        }},
+        {"$set": {
+            "completion_date": {
+                "$cond": [{"$and": [reached, {"$eq": ["$completed", False]}]}, now, "$completion_date"]
+            },
+            "completed": reached
+        }}
+    ]
+
+# Running transaction summary fields kept on each goal document
+GOAL_SUMMARY_FIELDS = ("total_deposited", "transaction_count", "first_transaction_date", "last_transaction_date")
+
+# Helper function to read a goal's transaction summary from its running fields
+def get_transaction_stats(goal: dict) -> Optional[dict]:
+    if not goal.get("transaction_count"):
+        return None
+    return {
+        "total": goal["total_deposited"],
+        "min_date": goal["first_transaction_date"],
+        "max_date": goal["last_transaction_date"],
+        "count": goal["transaction_count"]
+    }
+
+# One-time migration: fill in the running summary on goals created before it existed
+async def backfill_goal_transaction_stats():
+    if not await db.goals.count_documents({"transaction_count": {"$exists": False}}, limit=1):
+        return
+    
+    summaries = await db.transactions.aggregate([
+        {"$group": {
+            "_id": {"goal_id": "$goal_id", "user_id": "$user_id"},
+            "total_deposited": {"$sum": "$amount"},
+            "transaction_count": {"$sum": 1},
+            "first_transaction_date": {"$min": "$transaction_date"},
+            "last_transaction_date": {"$max": "$transaction_date"}
+        }}
+    ]).to_list(None)
     
-    if not transactions:
+    # Only touch goals that don't track their own summary yet
+    updates = [
+        UpdateOne(
+            {"id": summary["_id"]["goal_id"], "user_id": summary["_id"]["user_id"], "transaction_count": {"$exists": False}},
+            {"$set": {field: summary[field] for field in GOAL_SUMMARY_FIELDS}}
+        )
+        for summary in summaries
+    ]
+    if updates:
+        await db.goals.bulk_write(updates, ordered=False)
+    
+    # Goals without any transactions
+    await db.goals.update_many(
+        {"transaction_count": {"$exists": False}},
+        {"$set": {"total_deposited": 0.0, "transaction_count": 0}}
+    )
+
+# Helper function to calculate goal estimates
+def calculate_goal_estimates(goal: Goal, stats: Optional[dict], now: datetime) -> dict:
+    if not stats:
         return {
             "estimated_days_to_completion": None,
             "estimated_completion_date": None,
             "average_daily_savings": None
         }
     
-    # Sort transactions by date
-    transactions.sort(key=lambda x: x["transaction_date"])
-    
     # Calculate time-based savings rate
-    first_transaction_date = transactions[0]["transaction_date"]
-    last_transaction_date = transactions[-1]["transaction_date"]
+    first_transaction_date = stats["min_date"]
+    last_transaction_date = stats["max_date"]
     
     # If all transactions are on the same day, use a different approach
     if first_transaction_date.date() == last_transaction_date.date():
         # Use the total amount from today as daily rate
-        total_today = sum(t["amount"] for t in transactions)
-        average_daily_savings = total_today
+        average_daily_savings = stats["total"]
     else:
         # Calculate days between first and last transaction
         days_span = (last_transaction_date - first_transaction_date).days
@@ -163,8 +342,7 @@ async def calculate_goal_estimates(goal: Goal) -> dict:
             days_span = 1  # Avoid division by zero
         
         # Calculate average daily savings
-        total_amount = sum(t["amount"] for t in transactions)
-        average_daily_savings = total_amount / days_span
+        average_daily_savings = stats["total"] / days_span
     
     # Calculate remaining amount and estimate days to completion
     remaining_amount = goal.target_amount - goal.current_amount
@@ -172,7 +350,7 @@ async def calculate_goal_estimates(goal: Goal) -> dict:
     if remaining_amount <= 0:
         return {
             "estimated_days_to_completion": 0,
-            "estimated_completion_date": datetime.utcnow(),
+            "estimated_completion_date": now,
             "average_daily_savings": average_daily_savings
         }
     
@@ -184,7 +362,7 @@ async def calculate_goal_estimates(goal: Goal) -> dict:
         }
     
     estimated_days = remaining_amount / average_daily_savings
-    estimated_completion_date = datetime.utcnow() + timedelta(days=estimated_days)
+    estimated_completion_date = now + timedelta(days=estimated_days)
     
     return {
         "estimated_days_to_completion": estimated_days,
@@ -192,60 +370,90 @@ async def calculate_goal_estimates(goal: Goal) -> dict:
         "average_daily_savings": average_daily_savings
     }
 
+# Helper function to assemble the progress report for a goal
+def build_goal_progress(goal: Goal, stats: Optional[dict], now: datetime) -> GoalProgress:
+    progress_percentage = (goal.current_amount / goal.target_amount) * 100 if goal.target_amount > 0 else 0
+    remaining_amount = goal.target_amount - goal.current_amount
+    
+    estimates = calculate_goal_estimates(goal, stats, now)
+    
+    return GoalProgress(
+        goal=goal,
+        progress_percentage=progress_percentage,
+        remaining_amount=remaining_amount,
+        estimated_days_to_completion=estimates["estimated_days_to_completion"],
+        estimated_completion_date=estimates["estimated_completion_date"],
+        average_daily_savings=estimates["average_daily_savings"]
+    )
+
 # Goal endpoints (now user-specific)
 @api_router.post("/goals", response_model=Goal)
-async def create_goal(goal_input: GoalCreate, user_id: str):
-    # Verify user exists
-    user = await get_user_by_id(user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    goal_dict = goal_input.dict()
+async def create_goal(goal_input: GoalCreate, user_id: str = Depends(current_user)):
+    goal_dict = goal_input.model_dump()
     goal_dict["user_id"] = user_id
-    goal_obj = Goal(**goal_dict)
-    await db.goals.insert_one(goal_obj.dict())
+    goal_obj = Goal(**goal_dict, created_date=utcnow())
+    goal_doc = {**goal_obj.model_dump(), "total_deposited": 0.0, "transaction_count": 0}
+    if goal_input.test_session_id is not None:
+        goal_doc["test_session_id"] = goal_input.test_session_id
+    await db.goals.insert_one(goal_doc)
     return goal_obj
 
 @api_router.get("/goals", response_model=List[Goal])
-async def get_goals(user_id: str):
-    # Verify user exists
-    user = await get_user_by_id(user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    goals = await db.goals.find({"user_id": user_id}).to_list(1000)
-    return [Goal(**goal) for goal in goals]
+async def get_goals(
+    user_id: str = Depends(current_user),
+    after: Optional[datetime] = None,
+    after_id: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=1000)
+):
+    # Keyset pagination: pass the last goal's created_date and id to get the next page
+    query = keyset_filter({"user_id": user_id}, "created_date", after, after_id)
+    projection = {"_id": 0, "test_session_id": 0, **{field: 0 for field in GOAL_SUMMARY_FIELDS}}
+    cursor = db.goals.find(query, projection).sort(
+        [("created_date", -1), ("id", -1)]
+    ).limit(limit)
+    # Stored goals already match the Goal schema, so stream them straight out
+    return StreamingResponse(stream_json_array(cursor), media_type="application/json")
 
 @api_router.get("/goals/{goal_id}", response_model=Goal)
-async def get_goal(goal_id: str, user_id: str):
-    goal = await db.goals.find_one({"id": goal_id, "user_id": user_id})
+async def get_goal(goal_id: str, user_id: str = Depends(current_user)):
+    goal = await db.goals.find_one({"id": goal_id, "user_id": user_id}, {"_id": 0})
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
-    return Goal(**goal)
+    # Trusted data we stored ourselves, skip re-validation
+    return Goal.model_construct(**goal)
 
 @api_router.get("/goals/{goal_id}/progress", response_model=GoalProgress)
-async def get_goal_progress(goal_id: str, user_id: str):
-    goal = await db.goals.find_one({"id": goal_id, "user_id": user_id})
+async def get_goal_progress(goal_id: str, user_id: str = Depends(current_user)):
+    # The transaction summary is kept on the goal itself, so this is a single lookup
+    goal = await db.goals.find_one({"id": goal_id, "user_id": user_id}, {"_id": 0})
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     
-    goal_obj = Goal(**goal)
-    progress_percentage = (goal_obj.current_amount / goal_obj.target_amount) * 100 if goal_obj.target_amount > 0 else 0
-    remaining_amount = goal_obj.target_amount - goal_obj.current_amount
+    return build_goal_progress(Goal.model_construct(**goal), get_transaction_stats(goal), utcnow())
+
+@api_router.get("/dashboard", response_model=List[GoalProgress])
+async def get_dashboard(user_id: str = Depends(current_user)):
+    # Each goal carries its own transaction summary, so one query covers everything
+    goals = await db.goals.find({"user_id": user_id}, {"_id": 0}).to_list(1000)
     
-    estimates = await calculate_goal_estimates(goal_obj)
+    now = utcnow()
+    return [
+        build_goal_progress(Goal.model_construct(**goal), get_transaction_stats(goal), now)
+        for goal in goals
+    ]
+
+@api_router.delete("/goals")
+async def delete_test_session_goals(test_session_id: str, user_id: str = Depends(current_user)):
+    # Delete every goal of the user tagged with this test session, plus their transactions
+    goal_ids = await db.goals.distinct("id", {"user_id": user_id, "test_session_id": test_session_id})
+    if goal_ids:
+        await db.goals.delete_many({"id": {"$in": goal_ids}, "user_id": user_id})
+        await db.transactions.delete_many({"goal_id": {"$in": goal_ids}, "user_id": user_id})
     
-    return GoalProgress(
-        goal=goal_obj,
-        progress_percentage=progress_percentage,
-        remaining_amount=remaining_amount,
-        estimated_days_to_completion=estimates["estimated_days_to_completion"],
-        estimated_completion_date=estimates["estimated_completion_date"],
-        average_daily_savings=estimates["average_daily_savings"]
-    )
+    return {"message": "Goals deleted successfully", "deleted_count": len(goal_ids)}
 
 @api_router.delete("/goals/{goal_id}")
-async def delete_goal(goal_id: str, user_id: str):
+async def delete_goal(goal_id: str, user_id: str = Depends(current_user)):
     # Delete the goal (only if it belongs to the user)
     result = await db.goals.delete_one({"id": goal_id, "user_id": user_id})
     if result.deleted_count == 0:
@@ -257,42 +465,88 @@ async def delete_goal(goal_id: str, user_id: str):
     return {"message": "Goal deleted successfully"}
 
 # Transaction endpoints (now user-specific)
-@api_router.post("/transactions", response_model=Transaction)
-async def add_transaction(transaction_input: TransactionCreate, user_id: str):
-    # Check if goal exists and belongs to user
-    goal = await db.goals.find_one({"id": transaction_input.goal_id, "user_id": user_id})
-    if not goal:
+@api_router.post("/transactions", response_model=TransactionResult)
+async def add_transaction(transaction_input: TransactionCreate, user_id: str = Depends(current_user)):
+    now = utcnow()
+    
+    # Atomically update goal's current amount and get the new state back
+    # in one round-trip; this doubles as the ownership check
+    updated_goal = await db.goals.find_one_and_update(
+        {"id": transaction_input.goal_id, "user_id": user_id},
+        goal_deposit_update(transaction_input.amount, now),
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     
     # Create transaction
-    transaction_dict = transaction_input.dict()
+    transaction_dict = transaction_input.model_dump()
     transaction_dict["user_id"] = user_id
-    transaction_obj = Transaction(**transaction_dict)
-    await db.transactions.insert_one(transaction_obj.dict())
+    transaction_obj = Transaction(**transaction_dict, transaction_date=now)
+    await db.transactions.insert_one(transaction_obj.model_dump())
     
-    # Update goal's current amount
-    new_amount = goal["current_amount"] + transaction_input.amount
-    completed = new_amount >= goal["target_amount"]
+    # Return the goal as updated so clients don't need to re-fetch it
+    return TransactionResult(transaction=transaction_obj, goal=Goal.model_construct(**updated_goal))
+
+@api_router.post("/transactions/batch", response_model=List[Transaction])
+async def add_transactions_batch(transaction_inputs: List[TransactionCreate], user_id: str = Depends(current_user)):
+    if not transaction_inputs:
+        return []
     
-    update_data = {
-        "current_amount": new_amount,
-        "completed": completed
-    }
+    # Sum and count deposits per goal so each goal gets a single update
+    totals = {}
+    counts = {}
+    for transaction_input in transaction_inputs:
+        totals[transaction_input.goal_id] = totals.get(transaction_input.goal_id, 0.0) + transaction_input.amount
+        counts[transaction_input.goal_id] = counts.get(transaction_input.goal_id, 0) + 1
     
-    if completed and not goal["completed"]:
-        update_data["completion_date"] = datetime.utcnow()
+    # Check all goals exist and belong to user before writing anything
+    owned = await db.goals.count_documents({"id": {"$in": list(totals)}, "user_id": user_id})
+    if owned != len(totals):
+        raise HTTPException(status_code=404, detail="Goal not found")
     
-    await db.goals.update_one(
-        {"id": transaction_input.goal_id, "user_id": user_id},
-        {"$set": update_data}
+    now = utcnow()
+    result = await db.goals.bulk_write(
+        [
+            UpdateOne({"id": goal_id, "user_id": user_id}, goal_deposit_update(amount, now, counts[goal_id]))
+            for goal_id, amount in totals.items()
+        ],
+        ordered=False
     )
+    # A goal deleted since the ownership check was not credited, so drop its
+    # transactions and keep the ones for goals that were. Ids are never reused,
+    # so a goal that still exists now is one the bulk write matched
+    credited = totals.keys()
+    if result.matched_count != len(totals):
+        credited = set(await db.goals.distinct("id", {"id": {"$in": list(totals)}, "user_id": user_id}))
+    
+    transaction_objs = [
+        Transaction(**transaction_input.model_dump(), user_id=user_id, transaction_date=now)
+        for transaction_input in transaction_inputs
+        if transaction_input.goal_id in credited
+    ]
+    if not transaction_objs:
+        return []
+    await db.transactions.insert_many([t.model_dump() for t in transaction_objs], ordered=False)
     
-    return transaction_obj
+    return transaction_objs
 
 @api_router.get("/transactions/{goal_id}", response_model=List[Transaction])
-async def get_transactions(goal_id: str, user_id: str):
-    transactions = await db.transactions.find({"goal_id": goal_id, "user_id": user_id}).to_list(1000)
-    return [Transaction(**transaction) for transaction in transactions]
+async def get_transactions(
+    goal_id: str,
+    user_id: str = Depends(current_user),
+    after: Optional[datetime] = None,
+    after_id: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=1000)
+):
+    # Keyset pagination: pass the last transaction's date and id to get the next page
+    query = keyset_filter({"goal_id": goal_id, "user_id": user_id}, "transaction_date", after, after_id)
+    cursor = db.transactions.find(query, {"_id": 0}).sort(
+        [("transaction_date", -1), ("id", -1)]
+    ).limit(limit)
+    # Stored transactions already match the Transaction schema, so stream them straight out
+    return StreamingResponse(stream_json_array(cursor), media_type="application/json")
 
 @api_router.get("/")
 async def root():
@@ -316,6 +570,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    await db.users.create_index("username", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.goals.create_index([("user_id", 1), ("id", 1)], unique=True)
+    await db.goals.create_index([("user_id", 1), ("created_date", -1), ("id", -1)])
+    await db.transactions.create_index([("goal_id", 1), ("user_id", 1), ("transaction_date", 1), ("id", 1)])
+
+@app.on_event("startup")
+async def run_migrations():
+    await backfill_goal_transaction_stats()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
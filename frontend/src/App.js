@@ -33,10 +33,34 @@ function App() {
   useEffect(() => {
     const storedUser = localStorage.getItem("user");
     if (storedUser) {
-      setUser(JSON.parse(storedUser));
+      const parsedUser = JSON.parse(storedUser);
+      // Sessions saved before token auth have no access token, so log them out
+      if (parsedUser.access_token) {
+        setUser(parsedUser);
+      } else {
+        localStorage.removeItem("user");
+      }
     }
   }, []);
 
+  // An expired or rejected token sends the user back to the login screen.
+  // Only authenticated calls count, a wrong password on /login is also a 401
+  useEffect(() => {
+    const interceptor = axios.interceptors.response.use(
+      response => response,
+      error => {
+        if (error.response?.status === 401 && error.config?.headers?.Authorization) {
+          handleLogout();
+          setAuthError("Your session has expired, please log in again");
+          setShowRegisterForm(false);
+          setShowLoginForm(true);
+        }
+        return Promise.reject(error);
+      }
+    );
+    return () => axios.interceptors.response.eject(interceptor);
+  }, []);
+
   // Fetch goals when user is logged in
   useEffect(() => {
     if (user) {
@@ -94,17 +118,26 @@ function App() {
     localStorage.removeItem("user");
     setGoals([]);
     setGoalProgress({});
+    setSelectedGoal(null);
+    setShowCreateForm(false);
   };
 
+  // Request config carrying the user's bearer token
+  const authConfig = () => ({
+    headers: { Authorization: `Bearer ${user.access_token}` }
+  });
+
   const fetchGoals = async () => {
     if (!user) return;
     
     try {
-      const response = await axios.get(`${API}/goals?user_id=${user.id}`);
-      setGoals(response.data);
+      const response = await axios.get(`${API}/goals`, authConfig());
+      // The API lists newest first; keep showing goal cards oldest first
+      const orderedGoals = [...response.data].reverse();
+      setGoals(orderedGoals);
       
       // Fetch progress for each goal
-      for (const goal of response.data) {
+      for (const goal of orderedGoals) {
         fetchGoalProgress(goal.id);
       }
     } catch (error) {
@@ -116,7 +149,7 @@ function App() {
     if (!user) return;
     
     try {
-      const response = await axios.get(`${API}/goals/${goalId}/progress?user_id=${user.id}`);
+      const response = await axios.get(`${API}/goals/${goalId}/progress`, authConfig());
       setGoalProgress(prev => ({
         ...prev,
         [goalId]: response.data
@@ -131,10 +164,10 @@ function App() {
     if (!user) return;
     
     try {
-      await axios.post(`${API}/goals?user_id=${user.id}`, {
+      await axios.post(`${API}/goals`, {
         name: goalName,
         target_amount: parseFloat(targetAmount)
-      });
+      }, authConfig());
       
       setGoalName("");
       setTargetAmount("");
@@ -150,11 +183,11 @@ function App() {
     if (!selectedGoal || !user) return;
     
     try {
-      await axios.post(`${API}/transactions?user_id=${user.id}`, {
+      await axios.post(`${API}/transactions`, {
         goal_id: selectedGoal.id,
         amount: parseFloat(addMoneyAmount),
         description: addMoneyDescription
-      });
+      }, authConfig());
       
       setAddMoneyAmount("");
       setAddMoneyDescription("");
@@ -170,7 +203,7 @@ function App() {
     
     if (window.confirm("Are you sure you want to delete this goal?")) {
       try {
-        await axios.delete(`${API}/goals/${goalId}?user_id=${user.id}`);
+        await axios.delete(`${API}/goals/${goalId}`, authConfig());
         fetchGoals();
       } catch (error) {
         console.error("Error deleting goal:", error);
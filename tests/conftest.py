@@ -0,0 +1,27 @@
+import os
+import secrets
+import sys
+import uuid
+from pathlib import Path
+
+import mongomock_motor
+import pytest
+
+os.environ.setdefault("JWT_SECRET", secrets.token_urlsafe(64))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+import server  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Run the real app, startup indexes included, against an in-memory database
+    mock_client = mongomock_motor.AsyncMongoMockClient(tz_aware=True)
+    monkeypatch.setattr(server, "client", mock_client)
+    monkeypatch.setattr(server, "db", mock_client["test_server"])
+    with TestClient(server.app) as client:
+        response = client.post("/api/register", json={"username": f"test_user_{uuid.uuid4()}", "password": "test_password"})
+        assert response.status_code == 200
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        yield client
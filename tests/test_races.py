@@ -0,0 +1,55 @@
+"""In-process tests for races the live API tests cannot time from the outside"""
+import uuid
+
+import server
+
+
+def test_batch_skips_goal_deleted_before_write(client, monkeypatch):
+    """A goal deleted between the ownership check and the bulk write gets neither credit nor transactions"""
+    kept_goal = client.post("/api/goals", json={"name": "Kept", "target_amount": 1000.0}).json()
+    doomed_goal = client.post("/api/goals", json={"name": "Doomed", "target_amount": 1000.0}).json()
+
+    # Delete the second goal right before the batch writes, after its ownership check.
+    # Every db.goals access builds a new collection object, so patch the class
+    collection_type = type(server.db.goals)
+    bulk_write = collection_type.bulk_write
+
+    async def racing_bulk_write(self, *args, **kwargs):
+        if self.name == "goals":
+            await self.delete_one({"id": doomed_goal["id"]})
+        return await bulk_write(self, *args, **kwargs)
+
+    monkeypatch.setattr(collection_type, "bulk_write", racing_bulk_write)
+
+    response = client.post("/api/transactions/batch", json=[
+        {"goal_id": kept_goal["id"], "amount": 40.0, "description": "Kept goal"},
+        {"goal_id": doomed_goal["id"], "amount": 60.0, "description": "Deleted goal"}
+    ])
+    assert response.status_code == 200
+    returned = response.json()
+    assert [transaction["goal_id"] for transaction in returned] == [kept_goal["id"]]
+
+    # The kept goal is credited with exactly the transaction stored for it
+    stored = client.get(f"/api/transactions/{kept_goal['id']}").json()
+    assert [transaction["id"] for transaction in stored] == [transaction["id"] for transaction in returned]
+    progress = client.get(f"/api/goals/{kept_goal['id']}/progress").json()
+    assert progress["goal"]["current_amount"] == 40.0
+    assert progress["average_daily_savings"] == 40.0
+
+    # Nothing was written for the deleted goal
+    assert client.get(f"/api/transactions/{doomed_goal['id']}").json() == []
+
+
+def test_register_race_reports_existing_username(client, monkeypatch):
+    """Two registrations that both pass the username check get one 200 and one 400, not a 500"""
+    # Let both requests through the existence check, as if they raced
+    async def no_user(username, projection=None):
+        return None
+
+    monkeypatch.setattr(server, "get_user_by_username", no_user)
+
+    user_data = {"username": f"test_user_{uuid.uuid4()}", "password": "test_password"}
+    assert client.post("/api/register", json=user_data).status_code == 200
+    response = client.post("/api/register", json=user_data)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Username already exists"